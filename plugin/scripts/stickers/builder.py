@@ -12,6 +12,15 @@ from . import sticker
 class Builder:
     """Abstract Class. Creates, manipulates and organices complex sticker systems"""
 
+    __slots__ = (
+        "_parser",
+        "root_path",
+        "character_name",
+        "sticker_definitions",
+        "stickers",
+        "sticker_objects",
+    )
+
     def __init__(self, root_path="", character_name="", sticker_definitions=None):
         """Initialices Builder's class atributes
 
@@ -44,31 +53,46 @@ class Builder:
             creathe each sticker . Defaults to None.
 
         """
-        self.parser = parser.Parser()
+        self._parser = None
         self.root_path = root_path
         self.character_name = character_name
 
-        self.sticker_definitions = sticker_definitions if sticker_definitions else []
+        self.sticker_definitions = sticker_definitions or ()
+        # Sticker name -> sticker_data of the built sticker
         self.stickers = {}
+        # Sticker name -> built sticker.Sticker
+        self.sticker_objects = {}
+
+    @property
+    def parser(self):
+        """parser.Parser: The parser shared with the stickers, fetched on first access
+        so an empty Builder doesn't import the Maya modules until it actually needs them"""
+        if self._parser is None:
+            self._parser = parser.shared_parser()
+        return self._parser
 
     def create_stickers(self):
         """Travels all stickers declared inside the class' sticker_definition
-        and calls _create_sticker each time"""
-        for definition in self.sticker_definitions:
-            self._create_sticker(definition)
+        and calls _create_sticker each time
+
+        The whole build runs inside a single parser.batched context,
+        so it is undone at once and the viewport is only refreshed at the end.
+        """
+        with self.parser.batched():
+            for definition in self.sticker_definitions:
+                self._create_sticker(definition)
 
     def _create_sticker(self, definition):
         """Abstract function, creates a single sticker given its definition,
+        inside its own batched context unless it is already part of a bigger build.
         Args:
             definition (dict): Sticker creation parameters.
         """
-        sticker_obj = sticker.Sticker(**definition)
-        sticker_obj.create()
-        self.stickers.update(
-            {
-                definition.get('name'): sticker_obj.sticker_data
-            }
-        )
+        with self.parser.batched():
+            sticker_obj = sticker.Sticker(**definition)
+            sticker_obj.create()
+        self.stickers[sticker_obj.name] = sticker_obj.sticker_data
+        self.sticker_objects[sticker_obj.name] = sticker_obj
 
     def add_stickers(self, definition):
         """Auxiliary function. Lets the User create more stickers at any
@@ -76,8 +100,19 @@ class Builder:
 
         Args:
             definition (dict/list): Sticker creation parameters, can be a list fo definitions
+
+        Raises:
+            TypeError: If definition is neither a dict nor a list of dicts
         """
         if isinstance(definition, list):
-            for sticker_def in definition:
-                self._create_sticker(sticker_def)
+            with self.parser.batched():
+                for sticker_def in definition:
+                    self._create_sticker(sticker_def)
+            return
+        if not isinstance(definition, dict):
+            raise TypeError(
+                "Sticker definition must be a dict or a list of dicts, got {0}".format(
+                    type(definition).__name__
+                )
+            )
         self._create_sticker(definition)
@@ -7,8 +7,85 @@
 
 # pylint: disable=[too-many-public-methods,consider-using-f-string]
 
+import contextlib
 import importlib
 import os
+import re
+
+# "sticker" as a whole "_" separated token of a node name
+STICKER_TOKEN_RE = re.compile(r"(?<![^_])sticker(?![^_])")
+
+# place2dTexture -> file attribute pairs, as Maya's default texture placement wires them
+P2D_TO_FILE_ATTRS = (
+    ("outUV", "uvCoord"),
+    ("outUvFilterSize", "uvFilterSize"),
+    ("vertexCameraOne", "vertexCameraOne"),
+    ("vertexUvOne", "vertexUvOne"),
+    ("vertexUvThree", "vertexUvThree"),
+    ("vertexUvTwo", "vertexUvTwo"),
+    ("coverage", "coverage"),
+    ("mirrorU", "mirrorU"),
+    ("mirrorV", "mirrorV"),
+    ("noiseUV", "noiseUV"),
+    ("offset", "offset"),
+    ("repeatUV", "repeatUV"),
+    ("rotateFrame", "rotateFrame"),
+    ("rotateUV", "rotateUV"),
+    ("stagger", "stagger"),
+    ("translateFrame", "translateFrame"),
+    ("wrapU", "wrapU"),
+    ("wrapV", "wrapV"),
+)
+
+# file -> projection attribute pairs
+FILE_TO_PROJECTION_ATTRS = (
+    ("outColor", "image"),
+    ("outTransparency", "transparency"),
+)
+
+# place3dTexture -> projection attribute pairs
+P3D_TO_PROJECTION_ATTRS = (("worldInverseMatrix", "placementMatrix"),)
+
+# Colour source -> shader attribute pairs (aiMatte and viewport lambert)
+COLOR_TO_SHADER_ATTRS = (("outColor", "color"),)
+
+# Control shape types -> maya.cmds curve creation command
+_SHAPE_FN = {"circle": "circle", "square": "nurbsSquare"}
+
+
+def _plug_pairs(source, destination, attr_pairs):
+    """Expands (source_attr, destination_attr) pairs into full plug path pairs
+
+    Args:
+        source (str): Source node name
+        destination (str): Destination node name
+        attr_pairs (tuple): Pairs of attribute names, one per connection
+
+    Returns:
+        list: (source plug, destination plug) tuples
+    """
+    return [
+        (f"{source}.{src_attr}", f"{destination}.{dst_attr}")
+        for src_attr, dst_attr in attr_pairs
+    ]
+
+
+_SHARED_PARSER = None
+
+
+def shared_parser():
+    """Returns the Parser shared by every Sticker and Builder, created on first use
+
+    Sharing it keeps the node cache of node_exists alive between stickers,
+    per sticker settings are applied with Parser.building.
+
+    Returns:
+        Parser: The shared parser
+    """
+    global _SHARED_PARSER  # pylint: disable=global-statement
+    if _SHARED_PARSER is None:
+        _SHARED_PARSER = Parser()
+    return _SHARED_PARSER
 
 
 class Parser:
@@ -16,13 +93,74 @@ class Parser:
     globals in order to avoid hardcoding maya commands
     """
 
-    def __init__(self):
+    def __init__(self, assume_new=False):
+        # When True, the creators skip their "already exists" checks.
+        # Only meant for fresh builds where no node of the sticker exists yet.
+        self.assume_new = assume_new
+        # Node name -> MObjectHandle of every node found by node_exists
+        self._node_cache = {}
+        # True while inside the outermost batched context
+        self._batching = False
         try:
             self.cmds = importlib.import_module("maya.cmds")
-            self.pm = importlib.import_module("pymel.core")
+            self.om = importlib.import_module("maya.api.OpenMaya")
         except ModuleNotFoundError as e:
             print("## IGNORE: Module Import Error, {e}".format(e=e))
 
+    def node_exists(self, name):
+        """Checks if a node exists, remembering the nodes already found
+
+        Found nodes are cached as MObjectHandles, so checking them again only
+        validates the handle instead of running objExists.
+        A cached node that is deleted or renamed is looked up again.
+
+        Args:
+            name (str): Node name
+
+        Returns:
+            bool: True if the node exists
+        """
+        handle = self._node_cache.get(name)
+        if (
+            handle is not None
+            and handle.isValid()
+            and self.om.MFnDependencyNode(handle.object()).name() == name
+        ):
+            return True
+        if not self.cmds.objExists(name):
+            self._node_cache.pop(name, None)
+            return False
+        selection = self.om.MSelectionList()
+        selection.add(name)
+        self._node_cache[name] = self.om.MObjectHandle(selection.getDependNode(0))
+        return True
+
+    def _reuse_existing(self, name):
+        """Checks if a creator should return an already existing node instead of
+        creating it. Always False when assume_new is set.
+
+        Args:
+            name (str): Node name
+
+        Returns:
+            bool: True if the node exists and has to be reused
+        """
+        return not self.assume_new and self.node_exists(name)
+
+    def _existing_nodes(self, names):
+        """Finds which nodes of a list already exist with a single cmds.ls call.
+        Always empty when assume_new is set.
+
+        Args:
+            names (list of str): Node names
+
+        Returns:
+            set of str: Names of the nodes that have to be reused
+        """
+        if self.assume_new:
+            return set()
+        return set(self.cmds.ls(names) or [])
+
     def hierarchy_parent(self, hierarchy_list, master_node):
         """Parents a list of nodes in reverse order.
         Each element gets parented to the previous node in the array,
@@ -30,18 +168,15 @@ class Parser:
 
         Args:
             hierarchy_list (List): List of built nodes we want to parent as hierarchy
-            master_node (PyNode): Transform node that will be the parent of the entire hierarchy
-        """
-        # Creates a reverse ordered list
-        reverse_hierarchy_list = hierarchy_list[::-1]
-        # Creates a loop to get the object and its index
-        for idx, grp in enumerate(reverse_hierarchy_list):
-            # If the current grp is the first element of the hierarchy,
-            # we parent to the chainParent and stop de loop
-            if grp == hierarchy_list[0]:
-                self.parent_nodes(grp, master_node)
-                return
-            self.parent_nodes(grp, reverse_hierarchy_list[idx + 1])
+            master_node (str): Transform node that will be the parent of the entire hierarchy
+        """
+        if not hierarchy_list:
+            return
+        # Walks the list backwards, parenting each node to the previous one
+        for idx in range(len(hierarchy_list) - 1, 0, -1):
+            self.parent_nodes(hierarchy_list[idx], hierarchy_list[idx - 1])
+        # The first element of the hierarchy goes under the master node
+        self.parent_nodes(hierarchy_list[0], master_node)
 
     def update_name(self, chain, new_chain_part):
         """Updates the descriptor part of the node name with the parameter given
@@ -53,25 +188,7 @@ class Parser:
         Returns:
             str: Returns the new formatted string
         """
-        # Split
-        chain_split = chain.split("_")
-        for idx, chain_part in enumerate(chain_split):
-            if chain_part == "sticker":
-                chain_split[idx] = new_chain_part
-        return "_".join(chain_split)
-
-    def exec_func(self, func, *args, **kwargs):
-        """Abstract function to execute specific maya modules (self.cmds, pymel.core, etc.)
-        With any function and specific arguments or keyword arguments
-
-        Args:
-            func (function): function to execute
-
-        Returns:
-            misc: Returns the output result of executing said function.
-        """
-        result = func(*args, **kwargs)
-        return result
+        return STICKER_TOKEN_RE.sub(lambda _match: new_chain_part, chain)
 
     def point_on_poly_constraint(self, chain_name, driver, driven):
         """Creates a poitOnPolyConstraint between the driver geometry and a transform node
@@ -79,14 +196,12 @@ class Parser:
         Args:
             chain_name (str): name of the point_on_poly_constraint
             driver (list): Driver Geometry (or vertex)
-            driven (pymel.core.nodetypes.Transform): trasnform
+            driven (str): trasnform
         Returns:
-            pymel.core.nodetypes.PointOnPolyConstraint: point_on_poly_constraint Node
+            str: point_on_poly_constraint Node
         """
-        self.pm.select([driver, driven])
-        func = getattr(self.pm, "pointOnPolyConstraint")
-        output = func(name=chain_name)
-        output.offsetRotateX.set(-90)
+        output = self.cmds.pointOnPolyConstraint(driver, driven, name=chain_name)[0]
+        self.set_attribute(output, "offsetRotateX", -90)
         return output
 
     def apply_constraint(self, cns, drivers, driven, connections=None, **kwargs):
@@ -94,16 +209,15 @@ class Parser:
 
         Args:
             cns (str): Type of constraint to create
-            drivers (PyNode): Driver objects of the constraint
-            driven (PyNode): Driven Objects of constraint
+            drivers (str or list): Driver objects of the constraint
+            driven (str): Driven Objects of constraint
         Returns:
-            pymel.core.nodetypes.{cns}: Returns constraint Object
+            str: Returns constraint node name
         """
 
-        if self.cmds.objExists(kwargs.get("name")):
-            return self.pm.PyNode(kwargs.get("name"))
-        func = getattr(self.pm, cns)
-        cns = self.exec_func(func, drivers, driven, **kwargs)
+        if self._reuse_existing(kwargs.get("name")):
+            return kwargs.get("name")
+        cns = getattr(self.cmds, cns)(drivers, driven, **kwargs)[0]
         if connections:
             self.apply_constraint_connections(
                 connections.get("attribute"),
@@ -120,21 +234,20 @@ class Parser:
         Create simple circle shape (by default) oriented to x.
         Makes it the shape of the ctl_transform
         """
-        shape = {"circle": "circle", "square": "nurbSquare"}
-        func = getattr(self.pm, shape[shape_type])
-        # Check if ctl_transform has any children (shapes)
-        ctl_shape = self.exec_func(
-            func, name="_temp_{0}".format(ctl_transform.name()), normal=normal, **kwargs
-        )[0]
-        self.parent_shape(ctl_transform, ctl_shape.getShape())
-        self.pm.delete(ctl_shape)
+        cmds = self.cmds
+        func = getattr(cmds, _SHAPE_FN[shape_type])
+        ctl_shape = func(name=f"_temp_{ctl_transform}", normal=normal, **kwargs)[0]
+        # nurbsSquare builds one child transform per side, so gather every curve
+        curve_shapes = cmds.listRelatives(
+            ctl_shape, allDescendents=True, type="nurbsCurve"
+        )
+        cmds.parent(curve_shapes, ctl_transform, relative=True, shape=True)
+        cmds.delete(ctl_shape)
         return ctl_shape
 
     def parent_shape(self, transform, shape):
         """Parents a given shape to the specified transform"""
-        func = getattr(self.pm, "parent")
-
-        self.exec_func(func, shape, transform, relative=True, shape=True)
+        self.cmds.parent(shape, transform, relative=True, shape=True)
 
     def apply_constraint_connections(self, attribute, reverse_node, cns_name, weights):
         """Create connections to the contraint's weights.
@@ -148,14 +261,16 @@ class Parser:
             weights (dict): Dictionary describing the nature of the connection,
                             if its direct, it wont pass through the reverse node
         """
+        connections = []
         if reverse_node:
             rev_node = self.cmds.shadingNode("reverse", asUtility=True)
-            self.cmds.connectAttr(attribute, rev_node + ".inputX")
+            connections.append((attribute, f"{rev_node}.inputX"))
         for weight, direct_connection in weights.items():
             if direct_connection:
-                self.cmds.connectAttr(attribute, cns_name + "." + weight)
+                connections.append((attribute, f"{cns_name}.{weight}"))
                 continue
-            self.cmds.connectAttr(rev_node + ".outputX", cns_name + "." + weight)
+            connections.append((f"{rev_node}.outputX", f"{cns_name}.{weight}"))
+        self._create_utility_connections(connections)
 
     def create_plane(self, name, parent="", _position=None, **kwargs):
         """Creates a GeoPlane
@@ -168,46 +283,52 @@ class Parser:
         Returns:
             tuple: Plane's transform and shape
         """
-        if self.cmds.objExists(name):
-            return self.pm.PyNode(name), self.pm.PyNode(name + "Shape")
-
-        func = getattr(self.pm, "polyPlane")
-        plane, plane_shape = self.exec_func(func, name=name, **kwargs)
-        if parent:
-            self.parent_nodes(plane, parent)
+        if self._reuse_existing(name):
+            plane = name
+        else:
+            plane = self.cmds.polyPlane(name=name, **kwargs)[0]
+            if parent:
+                self.parent_nodes(plane, parent)
+        plane_shapes = self.cmds.listRelatives(plane, shapes=True)
+        plane_shape = plane_shapes[0] if plane_shapes else plane + "Shape"
         return plane, plane_shape
 
-    def create_group(self, nodes, *args, **kwargs):
+    def create_group(self, nodes, **kwargs):
         """Abstract function to custom create transform nodes.
 
+        Existing nodes are detected with a single cmds.ls call for the whole list,
+        and only the missing ones are created.
+
         Args:
             nodes (str or list): List of names to create
 
         Returns:
-            PyNode or list of PyNodes: returns every transform created
-        """
-        # Fetch the group function in pymel.core
-        func = getattr(self.pm, "group")
-
-        # If passed a list into nodes, executes recursively until completed
-        if isinstance(nodes, list):
-            # Creates a list with the created nodes
-            node_list = [self.create_group(node, *args, **kwargs) for node in nodes]
-            return node_list
-        if self.cmds.objExists(nodes):
-            return self.pm.PyNode(nodes)
-        # Creates single transform.
-        transform = self.exec_func(func, *args, name=nodes, empty=True, **kwargs)
-        return transform
-
-    def create_system(self, base_string, name_string, group_name_array):
+            str or list of str: returns every transform created
+        """
+        if not isinstance(nodes, list):
+            return self.create_group([nodes], **kwargs)[0]
+        existing_nodes = self._existing_nodes(nodes)
+        # Creates a list with the created (or already existing) nodes
+        node_list = [
+            node
+            if node in existing_nodes
+            else self.cmds.createNode("transform", name=node, skipSelect=True, **kwargs)
+            for node in nodes
+        ]
+        return node_list
+
+    def create_system(self, base_string, name_string, group_name_array, parent=None):
         """Base function that creates the transform nodes for an specific chain, name and groups
 
+        When a parent is given, the first group is created under it and every other group
+        under the previous one, so the chain doesn't need a hierarchy_parent afterwards.
+
         Args:
             parser (Parser): Parser to execute operations, will be replaced by an instance of class
             base_string (str): Name of parent sticker
             name_string (str): new descriptor name
             group_name_array (List[str]): list of group names that will compose the new system
+            parent (str, optional): Parent node of the resulting chain. Defaults to None.
 
         Returns:
             tuple: Returns a tuple of the new chain name and the newly created groups
@@ -218,15 +339,29 @@ class Parser:
             chain_base_name = self.update_name(base_string, name_string)
         # Generates new list of goup names
         main_control_groups = [
-            chain_base_name + "_" + new_group for new_group in group_name_array
+            "_".join((chain_base_name, new_group)) for new_group in group_name_array
         ]
-        created_groups = self.create_group(main_control_groups)
+        if parent is None:
+            return chain_base_name, self.create_group(main_control_groups)
+
+        existing_groups = self._existing_nodes(main_control_groups)
+        created_groups = []
+        for group in main_control_groups:
+            if group in existing_groups:
+                # Groups of a previous build are only moved if they aren't in place
+                self.parent_nodes(group, parent)
+            else:
+                group = self.cmds.createNode(
+                    "transform", name=group, parent=parent, skipSelect=True
+                )
+            created_groups.append(group)
+            parent = group
         return chain_base_name, created_groups
 
     def create_ik_handles(
         self, name="", start_joint="", end_effector="", solver="ikSCsolver"
     ):
-        """Wrapper of pm.ikHandle. Creates ikHandles with custom properties
+        """Wrapper of cmds.ikHandle. Creates ikHandles with custom properties
 
         Args:
             name (str, optional): Node name. Defaults to "".
@@ -237,40 +372,40 @@ class Parser:
         Returns:
             tuple: ikHandle object reference and effector object reference
         """
-        if self.cmds.objExists(name + "_ikh"):
-            return self.pm.PyNode(name + "_ikh"), self.pm.PyNode(name + "_eff")
-        func = getattr(self.pm, "ikHandle")
-
-        handle, effector = self.exec_func(
-            func,
+        if self._reuse_existing(name + "_ikh"):
+            return name + "_ikh", name + "_eff"
+        handle, effector = self.cmds.ikHandle(
             name=name + "_ikh",
             startJoint=start_joint,
             endEffector=end_effector,
             solver=solver,
         )
-        handle.visibility.set(False)
-        handle.translateZ.set(0)
-        return handle, self.pm.rename(effector, name + "_eff")
+        self.set_attribute(handle, "visibility", False)
+        self.set_attribute(handle, "translateZ", 0)
+        return handle, self.cmds.rename(effector, name + "_eff")
 
     def parent_nodes(self, childs, parent):
         """Parent all child nodes to specific node
 
+        Nodes that are already children of parent are skipped, as cmds.parent
+        raises an error for them.
+
         Args:
-            childs (list / pyNode): Node or list of nodes to parent
-            parent (pyNode): Parent node
+            childs (list / str): Node or list of nodes to parent
+            parent (str): Parent node
         """
-        func = getattr(self.pm, "parent")
-
-        if isinstance(childs, list):
-            for child in childs:
-                self.exec_func(func, child, parent)
-            return
-        self.exec_func(func, childs, parent)
+        if not isinstance(childs, list):
+            childs = [childs]
+        for child in childs:
+            if parent in (self.cmds.listRelatives(child, parent=True) or []):
+                continue
+            self.cmds.parent(child, parent)
 
     def create_attribute(self, node, keyable=True, channelBox=False, **kwargs):
         """Creates a custom attribute and sets it visible in the channelBox if requested
 
-        Extends pm.addAttr and pm.setAttr functionality
+        Extends cmds.addAttr and cmds.setAttr functionality.
+        The attribute's "type" is passed to Maya as its attributeType.
 
         Args:
             node (string): Node's name that will get the attribute
@@ -282,30 +417,38 @@ class Parser:
         Returns:
             dict: Dictionary {Attribute's longName : Attribute path}
         """
-        attribute_path = "{node}.{attr}".format(node=node, attr=kwargs.get("longName"))
+        long_name = kwargs.get("longName")
+        attribute_path = f"{node}.{long_name}"
+        output = {long_name: attribute_path}
 
-        if self.cmds.objExists(attribute_path):
-            return {kwargs.get("longName"): attribute_path}
+        if not self.assume_new and self.cmds.objExists(attribute_path):
+            return output
 
-        func = getattr(self.pm, "addAttr")
-        set_func = getattr(self.pm, "setAttr")
-
-        _attribute = self.exec_func(func, node, keyable=keyable, **kwargs)
+        if "type" in kwargs:
+            kwargs["attributeType"] = kwargs.pop("type")
+        self.cmds.addAttr(node, keyable=keyable, **kwargs)
 
         if channelBox:
-            self.exec_func(set_func, attribute_path, channelBox=channelBox)
-        output = {kwargs.get("longName"): attribute_path}
+            self.cmds.setAttr(attribute_path, channelBox=True)
         return output
 
     def set_attribute(self, node, attribute, value):
         """Sets the node's specified attribute to a value
 
         Args:
-            node (pyNode): Node to change its attribute
+            node (str): Node to change its attribute
             attribute (str): Attribute name
-            value (misc): Value for the specified attribute
+            value (misc): Value for the specified attribute,
+                          lists and tuples are set as double3 and strings as string
         """
-        getattr(node, attribute).set(value)
+        plug = "{0}.{1}".format(node, attribute)
+        if isinstance(value, (list, tuple)):
+            self.cmds.setAttr(plug, *value, type="double3")
+            return
+        if isinstance(value, str):
+            self.cmds.setAttr(plug, value, type="string")
+            return
+        self.cmds.setAttr(plug, value)
 
     def create_3d_texture(self, node, *args, translate=None, scale=None, **kwargs):
         """Creates a place 3d Texture node, and changes its transform
@@ -315,25 +458,22 @@ class Parser:
             transform (_type_, optional): _description_. Defaults to list().
             scale (_type_, optional): _description_. Defaults to list().
         """
-        func = getattr(self.pm, "createNode")
-        if self.cmds.objExists(kwargs.get("name")):
-            return self.pm.PyNode(kwargs.get("name"))
-        #     return self.pm.PyNode(kwargs.get("name"))
-        node = self.exec_func(func, node, *args, **kwargs)
+        if self._reuse_existing(kwargs.get("name")):
+            return kwargs.get("name")
+        node = self.cmds.createNode(node, *args, **kwargs)
         if translate:
-            node.translate.set(translate)
+            self.cmds.setAttr(f"{node}.translate", *translate, type="double3")
         if scale:
-            node.scale.set(scale)
+            self.cmds.setAttr(f"{node}.scale", *scale, type="double3")
         return node
 
     def create_utility_node(
-        self, node_type, node_name, *args, connections=None, attributes=None, **kwargs
+        self, node_type, node_name, connections=None, attributes=None, **kwargs
     ):
         """Creates any type of utility node in the node editor"""
-        if self.cmds.objExists(node_name):
-            return self.pm.PyNode(node_name)
-        func = getattr(self.pm, "shadingNode")
-        _node = self.exec_func(func, node_type, name=node_name, *args, **kwargs)
+        if self._reuse_existing(node_name):
+            return node_name
+        _node = self.cmds.shadingNode(node_type, name=node_name, **kwargs)
 
         if connections:
             self._create_utility_connections(connections)
@@ -344,34 +484,93 @@ class Parser:
 
     def _set_utility_values(self, node, attr_dict):
         for attr, value in attr_dict.items():
+            self.set_attribute(node, attr, value)
+
+    @contextlib.contextmanager
+    def batched(self):
+        """Context grouping every Maya edit made inside it
+
+        The edits are recorded as a single undo chunk, with the viewport refresh
+        suspended and the evaluation manager in DG mode, so Maya doesn't redraw
+        or rebuild the evaluation graph after every node created.
+        Nested batched contexts join the outermost one.
+        """
+        if self._batching:
+            yield self
+            return
+        cmds = self.cmds
+        self._batching = True
+        evaluation_mode = None
+        try:
+            cmds.undoInfo(openChunk=True)
+            cmds.refresh(suspend=True)
+            evaluation_mode = cmds.evaluationManager(query=True, mode=True)[0]
+            cmds.evaluationManager(mode="off")
+            yield self
+        finally:
             try:
-                self.cmds.setAttr("{0}.{1}".format(node, attr), value)
-            except:
-                self.pm.PyNode("{0}.{1}".format(node, attr)).set(value)
+                if evaluation_mode is not None:
+                    cmds.evaluationManager(mode=evaluation_mode)
+                cmds.refresh(suspend=False)
+                cmds.refresh(force=True)
+            finally:
+                cmds.undoInfo(closeChunk=True)
+                self._batching = False
 
-    def _create_utility_connections(self, connection_list, **kwargs):
-        """Creates connections between node_editor's utility nodes"""
+    @contextlib.contextmanager
+    def building(self, assume_new=False):
+        """Context of a single sticker build
+
+        Applies the sticker's assume_new while it is built,
+        restoring the previous value on exit.
+
+        Args:
+            assume_new (bool, optional): Skip the "already exists" checks. Defaults to False.
+        """
+        previous_assume_new = self.assume_new
+        self.assume_new = assume_new
+        try:
+            yield self
+        finally:
+            self.assume_new = previous_assume_new
+
+    def _create_utility_connections(self, connection_list):
+        """Creates connections between node_editor's utility nodes
+
+        Connections are made with cmds.connectAttr, so they are recorded in Maya's
+        undo queue together with the nodes they belong to.
+
+        Args:
+            connection_list (list): Connections to create, either as
+                                    (source, destination) plug tuples or as
+                                    {source: destination} dictionaries
+        """
+        connect_attr = self.cmds.connectAttr
         for pair in connection_list:
-            for orig_plug, dest_plug in pair.items():
-                self.cmds.connectAttr(orig_plug, dest_plug, **kwargs)
+            plug_pairs = pair.items() if isinstance(pair, dict) else (pair,)
+            for orig_plug, dest_plug in plug_pairs:
+                connect_attr(orig_plug, dest_plug)
+
+    def create_joint(self, nodes, parent="", position=None):
+        """Creates a joint directly under its parent and hides the drawStyle
 
-    def create_joint(self, nodes, *args, parent="", **kwargs):
-        """Creates a joint, hides the drawStyle, and parents to any node if requested
+        The joint is made with cmds.createNode, so it doesn't depend on the current
+        selection, and no parent command is needed afterwards.
 
         Args:
             nodes (string): Joint name
             parent (str, optional): Joint parent's name. Defaults to "".
+            position (list, optional): Joint translate, relative to its parent. Defaults to None.
 
         Returns:
-            pyNode: Joint Object reference
+            str: Joint name
         """
-        func = getattr(self.pm, "joint")
-        if self.cmds.objExists(nodes):
-            return self.pm.PyNode(nodes)
-        joint = self.exec_func(func, name=nodes, *args, **kwargs)
-
-        if parent:
-            self.parent_nodes(joint, parent)
+        if self._reuse_existing(nodes):
+            return nodes
+        create_kwargs = {"parent": parent} if parent else {}
+        joint = self.cmds.createNode("joint", name=nodes, skipSelect=True, **create_kwargs)
+        if position:
+            self.set_attribute(joint, "translate", position)
         self.set_attribute(joint, "drawStyle", 2)
         return joint
 
@@ -388,121 +587,25 @@ class Parser:
         # Connect a place2dtexture node to the file node
         place2dTexture = self.create_utility_node(
             "place2dTexture",
-            node_name=sticker_name
-            + "_"
-            + layer_name
-            + "_"
-            + texture_map
-            + "_place2dTexture",
+            node_name=f"{sticker_name}_{layer_name}_{texture_map}_place2dTexture",
             asUtility=True,
             attributes={"wrapU": 0, "wrapV": 0},
         )
-        file_node_name = "_".join([sticker_name, layer_name, texture_map])
+        file_node_name = f"{sticker_name}_{layer_name}_{texture_map}"
 
         file_node = self.create_utility_node(
             "file",
             node_name=file_node_name,
             asUtility=True,
-            connections=[
-                {
-                    "{0}.outUV".format(place2dTexture): "{0}.uvCoord".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.outUvFilterSize".format(
-                        place2dTexture
-                    ): "{0}.uvFilterSize".format(file_node_name)
-                },
-                {
-                    "{0}.vertexCameraOne".format(
-                        place2dTexture
-                    ): "{0}.vertexCameraOne".format(file_node_name)
-                },
-                {
-                    "{0}.vertexUvOne".format(place2dTexture): "{0}.vertexUvOne".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.vertexUvThree".format(
-                        place2dTexture
-                    ): "{0}.vertexUvThree".format(file_node_name)
-                },
-                {
-                    "{0}.vertexUvTwo".format(place2dTexture): "{0}.vertexUvTwo".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.coverage".format(place2dTexture): "{0}.coverage".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.mirrorU".format(place2dTexture): "{0}.mirrorU".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.mirrorV".format(place2dTexture): "{0}.mirrorV".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.noiseUV".format(place2dTexture): "{0}.noiseUV".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.offset".format(place2dTexture): "{0}.offset".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.repeatUV".format(place2dTexture): "{0}.repeatUV".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.rotateFrame".format(place2dTexture): "{0}.rotateFrame".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.rotateUV".format(place2dTexture): "{0}.rotateUV".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.stagger".format(place2dTexture): "{0}.stagger".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.translateFrame".format(
-                        place2dTexture
-                    ): "{0}.translateFrame".format(file_node_name)
-                },
-                {
-                    "{0}.wrapU".format(place2dTexture): "{0}.wrapU".format(
-                        file_node_name
-                    )
-                },
-                {
-                    "{0}.wrapV".format(place2dTexture): "{0}.wrapV".format(
-                        file_node_name
-                    )
-                },
-            ],
+            connections=_plug_pairs(place2dTexture, file_node_name, P2D_TO_FILE_ATTRS),
             attributes={
                 "useFrameExtension": is_sequence,
             },
         )
         if os.path.isfile(file_path):
-            file_node.setAttr("ftn", file_path)
+            self.set_attribute(file_node, "ftn", file_path)
         if frame_extension:
-            file_node.setAttr("frameExtension", int(frame_extension))
+            self.set_attribute(file_node, "frameExtension", int(frame_extension))
 
         return place2dTexture, file_node
 
@@ -510,31 +613,16 @@ class Parser:
         self, sticker_name, layer_name, texture_map, p3d, file_node
     ):
         # Create a projection node
-        projection_node_name = "_".join(
-            [sticker_name, layer_name, texture_map, "projection"]
-        )
+        projection_node_name = f"{sticker_name}_{layer_name}_{texture_map}_projection"
 
         projection_node = self.create_utility_node(
             "projection",
             node_name=projection_node_name,
             asUtility=True,
-            connections=[
-                {
-                    "{0}.outColor".format(file_node): "{0}.image".format(
-                        projection_node_name
-                    )
-                },
-                {
-                    "{0}.outTransparency".format(file_node): "{0}.transparency".format(
-                        projection_node_name
-                    )
-                },
-                {
-                    "{0}.worldInverseMatrix".format(p3d): "{0}.placementMatrix".format(
-                        projection_node_name
-                    )
-                },
-            ],
+            connections=(
+                _plug_pairs(file_node, projection_node_name, FILE_TO_PROJECTION_ATTRS)
+                + _plug_pairs(p3d, projection_node_name, P3D_TO_PROJECTION_ATTRS)
+            ),
             attributes={
                 "wrap": 0,
                 "defaultColorR": 0,
@@ -548,41 +636,47 @@ class Parser:
         self, sticker_name, layer_name, texture_map, projection
     ):
         # Create an aiMatte material
-        aiMatte_material_name = "_".join(
-            [sticker_name, layer_name, texture_map, "bake_shd"]
-        )
+        aiMatte_material_name = f"{sticker_name}_{layer_name}_{texture_map}_bake_shd"
         aiMatte_material = self.create_utility_node(
             "aiMatte",
             asShader=True,
             node_name=aiMatte_material_name,
-            connections=[
-                {
-                    "{0}.outColor".format(projection): "{0}.color".format(
-                        aiMatte_material_name
-                    )
-                },
-            ],
+            connections=_plug_pairs(
+                projection, aiMatte_material_name, COLOR_TO_SHADER_ATTRS
+            ),
         )
-        self.cmds.sets(
-            name="{0}_SG".format(aiMatte_material_name),
+        self.create_shading_group(aiMatte_material_name)
+        return aiMatte_material
+
+    def create_shading_group(self, shader, mesh=None):
+        """Creates the shading group of a shader and assigns it to a mesh if requested
+
+        Args:
+            shader (str): Shader node, the shading group is named "<shader>_SG"
+            mesh (str, optional): Geometry to assign the shading group to. Defaults to None.
+
+        Returns:
+            str: Shading group node
+        """
+        shading_group = self.cmds.sets(
+            name=f"{shader}_SG",
             empty=True,
             renderable=True,
             noSurfaceShader=True,
         )
-        self.cmds.connectAttr(
-            "{0}.outColor".format(aiMatte_material_name),
-            "{0}.surfaceShader".format(aiMatte_material_name + "_SG"),
-        )
-        return aiMatte_material
+        self.cmds.connectAttr(f"{shader}.outColor", f"{shading_group}.surfaceShader")
+        if mesh:
+            self.cmds.sets(mesh, edit=True, forceElement=shading_group)
+        return shading_group
 
     def create_sticker_viewport_material(self, sticker_name, last_projection, mesh):
         """
         Create a viewport material for the sticker
         """
-        sticker_vp_material_name = "_".join([mesh, "viewport_shd"])
-        layer_texture_name = "_".join([mesh, "sticker_layertxt"])
-        if self.cmds.objExists(sticker_vp_material_name):
-            return self.pm.PyNode(sticker_vp_material_name)
+        sticker_vp_material_name = f"{mesh}_viewport_shd"
+        layer_texture_name = f"{mesh}_sticker_layertxt"
+        if self.node_exists(sticker_vp_material_name):
+            return sticker_vp_material_name
         vp_layer_texture = self.create_utility_node(
             "layeredTexture",
             node_name=layer_texture_name,
@@ -592,27 +686,11 @@ class Parser:
             "lambert",
             node_name=sticker_vp_material_name,
             asShader=True,
-            connections=[
-                {
-                    "{0}.outColor".format(layer_texture_name): "{0}.color".format(
-                        sticker_vp_material_name
-                    )
-                },
-            ],
-        )
-        self.cmds.sets(
-            name="{0}_SG".format(sticker_vp_material_name),
-            empty=True,
-            renderable=True,
-            noSurfaceShader=True,
+            connections=_plug_pairs(
+                layer_texture_name, sticker_vp_material_name, COLOR_TO_SHADER_ATTRS
+            ),
         )
-
-        self.cmds.connectAttr(
-            "{0}.outColor".format(sticker_vp_material_name),
-            "{0}.surfaceShader".format(sticker_vp_material_name + "_SG"),
-        )
-
-        self.cmds.sets(mesh, e=True, forceElement=sticker_vp_material_name + "_SG")
+        self.create_shading_group(sticker_vp_material_name, mesh=mesh)
         return vp_material
 
     def geo_has_stickers(self, geo_mesh) -> bool:
@@ -626,10 +704,9 @@ class Parser:
             (bool): presence of a sticker connected to mesh
         """
         mesh_connections = []
-        for shape in self.cmds.listRelatives(geo_mesh):
-            mesh_connections.extend(self.cmds.listConnections(shape))
+        for shape in self.cmds.listRelatives(geo_mesh) or []:
+            mesh_connections.extend(self.cmds.listConnections(shape) or [])
         is_present = False
-        print(mesh_connections)
         if isinstance(mesh_connections, list):
             is_present = bool(
                 [s for s in mesh_connections if s.find("_POPConstraint") != -1]
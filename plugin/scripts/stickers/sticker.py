@@ -6,11 +6,53 @@
 # Cristina Fernandez Gomez <cristina.fernandez@antaruxa.com>, 2023
 
 # pylint: disable=[consider-using-f-string]
+import functools
 import re
 
 from . import parser
 from .vars import *  # pylint: disable=[ unused-wildcard-import, wildcard-import]
 
+# Frame number of an image sequence file, as in "name.0001.png" or "name.0001.exr.tx".
+# The optional second extension can't start with a digit, so "shot.12.0001.png" gives 0001
+FRAME_NUMBER_RE = re.compile(r"\.(\d+)(?:\.[^./\\\d][^./\\]*)?\.[^./\\]+$")
+
+# Image sequences driven by a keyable frame attribute need it visible in the channelBox
+SEQUENCE_ATTR_FLAGS = {"keyable": True, "channelBox": True}
+
+
+@functools.lru_cache(maxsize=None)
+def layer_attr_definitions(layer_name, is_sequence=False):
+    """Renders the layer attribute templates of INNIT_ATTR for a given layer
+
+    Each layer name is only rendered once per session, the placeholders are replaced with
+    str.replace as "{layerName}" and "{LayerName}" are the only ones used by the templates.
+
+    Args:
+        layer_name (str): Name of the layer
+        is_sequence (bool, optional): Adds SEQUENCE_ATTR_FLAGS to every definition.
+                                      Defaults to False.
+
+    Returns:
+        tuple: Attribute definitions ready for parser.create_attribute, must not be modified
+    """
+    capitalized_name = layer_name.capitalize()
+    definitions = []
+    for template in INNIT_ATTR[LAYER_ATTRIBUTES]:
+        definition = {
+            key: (
+                value.replace("{layerName}", layer_name).replace(
+                    "{LayerName}", capitalized_name
+                )
+                if isinstance(value, str)
+                else value
+            )
+            for key, value in template.items()
+        }
+        if is_sequence:
+            definition.update(SEQUENCE_ATTR_FLAGS)
+        definitions.append(definition)
+    return tuple(definitions)
+
 
 class Sticker:  # pylint: disable=too-many-instance-attributes
     """Objeto para manejar la creacion y almacenaje de informacion de un sticker del sistema facial
@@ -19,19 +61,44 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
     Posee todos los metodos para su creacion y manejo de datos.
     """
 
-    def __init__(self, name, layers=None, geometry=None, maps=None, file_path=None, is_sequence=0):
-        self.parser = parser.Parser()
+    __slots__ = (
+        "parser",
+        "file_path",
+        "name",
+        "layers",
+        "texture_maps",
+        "geometry",
+        "geo_mesh",
+        "root_name",
+        "is_sequence",
+        "assume_new",
+        "sticker_data",
+    )
+
+    def __init__(
+        self,
+        name,
+        layers=None,
+        geometry=None,
+        maps=None,
+        file_path=None,
+        is_sequence=0,
+        assume_new=False,
+    ):
+        self.parser = parser.shared_parser()
         self.file_path = file_path
         self.name = name
         self.layers = layers if layers else []
         self.texture_maps = maps if maps else []
         self.geometry = geometry if geometry else ""
-        self.geo_mesh = self.geometry.split(".")[0]
+        self.geo_mesh = self.geometry.partition(".")[0]
         self.root_name = "{name}_{description}".format(description="sticker", name=name)
         self.is_sequence = is_sequence
+        # assume_new skips the "already exists" checks of every node of this sticker,
+        # only set it when the sticker has never been built in the scene
+        self.assume_new = assume_new
 
         self.sticker_data = {
-            "self": self,
             CONTROLS: {STICKER_CONTROLS: [], LAYER_CONTROLS: []},
             MASTER_GROUPS: {
                 STICKER_MASTER_GROUP: {},
@@ -65,25 +132,25 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
         Crea los atributos que controlan diferentes funcionalidades del sticker
         Crea los constraints y dependencias del sticker
         """
+        with self.parser.building(assume_new=self.assume_new):
+            # Create top groups of the sticker
+            self.create_sticker_top_groups()
 
-        # Create top groups of the sticker
-        self.create_sticker_top_groups()
+            self.create_sticker_systems()
 
-        self.create_sticker_systems()
-
-        for layer in self.layers:
-            self.create_layer(
-                self.root_name,
-                layer.get("layerName"),
-                self.sticker_data.get(MASTER_GROUPS).get(LAYERS_MASTER_GROUP),
-            )
-        self.create_layer_controls()
+            for layer in self.layers:
+                self.create_layer(
+                    self.root_name,
+                    layer.get("layerName"),
+                    self.sticker_data[MASTER_GROUPS][LAYERS_MASTER_GROUP],
+                )
+            self.create_layer_controls()
 
-        self.create_attributes()
-        self.create_constraints()
-        self.create_offset_projection_subsystems()
-        self.create_layer_shading_nodes()
-        self.apply_to_material()
+            self.create_attributes()
+            self.create_constraints()
+            self.create_offset_projection_subsystems()
+            self.create_layer_shading_nodes()
+            self.apply_to_material()
 
     def create_sticker_top_groups(self):
         """Crea los grupos principales del sticker
@@ -122,7 +189,7 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
         """
         # Obtenemos el grupo anclado a la geometria (pointOnPolyConstraint),
         # todos los sistemas iran emparentados a este grupo
-        point_on_poly_root = self.sticker_data.get(MASTER_GROUPS).get(POP_MASTER_GROUP)
+        point_on_poly_root = self.sticker_data[MASTER_GROUPS][POP_MASTER_GROUP]
 
         self.create_geo_setup(self.root_name, point_on_poly_root)
         self.create_main_control(self.root_name, point_on_poly_root)
@@ -135,38 +202,36 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
         Args:
             sticker_name_string (str): Base Name Pattern
             layer_name (str): Name of the layer to create.
-            chain_parent (PyNode): Parent node of the resulting system
+            chain_parent (str): Parent node of the resulting system
 
         Returns:
             list: List of layer's nodes
         """
+        create_group = self.parser.create_group
+        create_joint = self.parser.create_joint
         chain_name, chain_transforms = self.parser.create_system(
-            sticker_name_string, layer_name, ["grp", "root", "cns", "ctl"]
+            sticker_name_string,
+            layer_name,
+            ["grp", "root", "cns", "ctl"],
+            parent=chain_parent,
         )
         self.sticker_data[CONTROLS][LAYER_CONTROLS].append(chain_transforms[-1])
-        self.parser.hierarchy_parent(chain_transforms, chain_parent)
-        chain_transforms[1].translateZ.set(1)
+        self.parser.set_attribute(chain_transforms[1], "translateZ", 1)
 
-        layer_proyection_root = self.parser.create_group(
+        layer_proyection_root = create_group(
             chain_name + "_translateOffset", parent=chain_transforms[0]
         )
 
-        ik_start = self.parser.create_joint(
-            chain_name + "_ik", parent=layer_proyection_root
-        )
+        ik_start = create_joint(chain_name + "_ik", parent=layer_proyection_root)
 
-        ik_end = self.parser.create_joint(
-            chain_name + "_ikEnd", position=[0, 0, 1], parent=ik_start
-        )
+        ik_end = create_joint(chain_name + "_ikEnd", position=[0, 0, 1], parent=ik_start)
         ik_handle, _effector = self.parser.create_ik_handles(
             name=chain_name, start_joint=ik_start, end_effector=ik_end
         )
 
         self.parser.parent_nodes(ik_handle, chain_transforms[-1])
 
-        layer_proyection_grp = self.parser.create_group(
-            chain_name + "_scaleOffset", parent=ik_start
-        )
+        layer_proyection_grp = create_group(chain_name + "_scaleOffset", parent=ik_start)
         layer_3d_texture = self.parser.create_3d_texture(
             "place3dTexture",
             name=chain_name + "_place3dTexture",
@@ -200,33 +265,20 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
             # Updates sticker data attributes dictionary with the created attribute
             self.sticker_data[ATTRIBUTES][STICKER_ATTRIBUTES].update(created_attr)
 
-        # Runs loop for each layer to create.
-        for layer in self.layers:
-            # Runs the definition of the layer only attributes to create
-            for attr_definition in INNIT_ATTR[LAYER_ATTRIBUTES]:
-                # Formats any string inside the Layer's attribute definitions
-                # with the equivalent value and creates a new formatted dictionary definition
-                attr_definition = {
-                    key: (
-                        value.format(
-                            layerName=layer.get("layerName"),
-                            LayerName=layer.get("layerName").capitalize(),
-                        )
-                        if isinstance(value, str)
-                        else value
-                    )
-                    for key, value in attr_definition.items()
-                }
-
-                if self.is_sequence == 2:
-                    attr_definition.update({"keyable":True,"channelBox":True})
-
-                # Runs the parser and returns the created attribute
-                created_attr = self.parser.create_attribute(
-                    main_control, **attr_definition
-                )
-                # Updates sticker data attributes dictionary with the created attribute
-                self.sticker_data[ATTRIBUTES][LAYER_ATTRIBUTES].update(created_attr)
+        # Renders every layer attribute definition first, then creates them all
+        is_sequence = self.is_sequence == 2
+        layer_attr_defs = [
+            attr_definition
+            for layer in self.layers
+            for attr_definition in layer_attr_definitions(
+                layer.get("layerName"), is_sequence
+            )
+        ]
+        layer_attributes = self.sticker_data[ATTRIBUTES][LAYER_ATTRIBUTES]
+        create_attribute = self.parser.create_attribute
+        for attr_definition in layer_attr_defs:
+            # Runs the parser and updates sticker data with the created attribute
+            layer_attributes.update(create_attribute(main_control, **attr_definition))
 
     def create_constraints(self):
         """Master function used to create all the constraints necessary
@@ -236,7 +288,7 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
         geo_setup_cns = self.create_cns_geo_setup()
         main_control_cns = self.createo_cns_main_control()
         # geoPlaneCns = self.create_cns_geo_setup()
-        self.sticker_data.get("constraints").update(
+        self.sticker_data["constraints"].update(
             {SYSTEM_GEOSETUP: geo_setup_cns, SYSTEM_MAINCONTROL: main_control_cns}
         )
         # self.connect_constraint_weights(main_control_cns)
@@ -252,19 +304,18 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
         Returns:
             list: Lista de transforms creados del sistema geoSetup
         """
+        create_joint = self.parser.create_joint
         # List of all geoSetup formatted names
         chain_name, chain_transforms = self.parser.create_system(
             sticker_name_string,
             SYSTEM_GEOSETUP,
             ["surface", "normalVector", "detach", "offset"],
+            parent=chain_parent,
         )
 
-        self.parser.hierarchy_parent(chain_transforms, chain_parent)
         # self.create_constraints(chain_transforms)
-        base_joint = self.parser.create_joint(
-            chain_name + "_ik", parent=chain_transforms[-1]
-        )
-        end_joint = self.parser.create_joint(
+        base_joint = create_joint(chain_name + "_ik", parent=chain_transforms[-1])
+        end_joint = create_joint(
             chain_name + "_ikEnd",
             position=[0, 0, 1],
             parent=base_joint,
@@ -287,7 +338,7 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
                 }
             }
         )
-        chain_transforms[-1].translateZ.set(-1)
+        self.parser.set_attribute(chain_transforms[-1], "translateZ", -1)
         return chain_transforms
 
     def create_look_at_camera(self, sticker_name_string, chain_parent):
@@ -295,15 +346,20 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
 
         Args:
             sticker_name_string (str): Base Name Pattern
-            chain_parent (PyNode): Parent node of the resulting system
+            chain_parent (str): Parent node of the resulting system
 
         Returns:
             list: List of lookAtCamera's nodes
         """
-        _chain_name, chain_transforms = self.parser.create_system(
-            sticker_name_string, "lookAtCamera", ["root", "cns", "aimSticker"]
+        chain_name, chain_transforms = self.parser.create_system(
+            sticker_name_string, "lookAtCamera", ["root", "cns"], parent=chain_parent
+        )
+        # aimSticker hangs from the root, next to cns
+        chain_transforms.append(
+            self.parser.create_group(
+                chain_name + "_aimSticker", parent=chain_transforms[0]
+            )
         )
-        self.parser.hierarchy_parent(chain_transforms[:-1], chain_parent)
         self.sticker_data[STICKER_SYSTEMS].update(
             {
                 "lookAtCamera": {
@@ -313,7 +369,6 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
                 }
             }
         )
-        self.parser.parent_nodes(chain_transforms[-1], chain_transforms[0])
         self.parser.parent_nodes(
             self.sticker_data[STICKER_SYSTEMS][SYSTEM_GEOSETUP]["ikHandle"],
             chain_transforms[1],
@@ -325,17 +380,16 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
 
         Args:
             sticker_name_string (str): Base Name Pattern
-            chain_parent (PyNode): Parent node of the resulting system
+            chain_parent (str): Parent node of the resulting system
             scale (float, optional): polyPlane creation scale. Defaults to 2.0.
 
         Returns:
             list: List of geoPlane's nodes
         """
         chain_name, chain_transforms = self.parser.create_system(
-            sticker_name_string, "geoPlane", ["root", "cns"]
+            sticker_name_string, "geoPlane", ["root", "cns"], parent=chain_parent
         )
         self.sticker_data[STICKER_GEOSETUP_DRIVEN_ROOTS].append(chain_transforms[0])
-        self.parser.hierarchy_parent(chain_transforms, chain_parent)
         bind_joint = self.parser.create_joint(
             chain_name + "_bind", parent=chain_transforms[-1]
         )
@@ -361,18 +415,23 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
 
         Args:
             sticker_name_string (str): Base Name Pattern
-            chain_parent (PyNode): Parent node of the resulting system
+            chain_parent (str): Parent node of the resulting system
 
         Returns:
             list: List of mainControl's nodes
         """
-        _chain_name, chain_transforms = self.parser.create_system(
+        chain_name, chain_transforms = self.parser.create_system(
             sticker_name_string,
             "mainControl",
-            ["root", "surfaceCtl", "npo", "cns", "ctl", "scaleInit"],
+            ["root", "surfaceCtl", "npo", "cns", "ctl"],
+            parent=chain_parent,
+        )
+        # scaleInit hangs from the npo, next to cns
+        chain_transforms.append(
+            self.parser.create_group(
+                chain_name + "_scaleInit", parent=chain_transforms[2]
+            )
         )
-        self.parser.hierarchy_parent(chain_transforms[:-1], chain_parent)
-        self.parser.parent_nodes(chain_transforms[-1], chain_transforms[-4])
         self.sticker_data[STICKER_SYSTEMS].update(
             {
                 "mainControl": {
@@ -395,19 +454,23 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
         Returns:
             dict: Dictionary containing all the constraints created
         """
+        pop_root = self.sticker_data[MASTER_GROUPS][POP_MASTER_GROUP]
+        geo_setup = self.sticker_data[STICKER_SYSTEMS][SYSTEM_GEOSETUP]
+        geo_setup_chain = geo_setup["chain_transforms"]
+
         # Creates a Point On Poly Constraint, driver is the vertex the system is attached on,
         # the driven is the POP_root group of the sticker
         cns = self.parser.point_on_poly_constraint(
-            self.sticker_data[MASTER_GROUPS][POP_MASTER_GROUP] + "Constraint",
+            pop_root + "Constraint",
             driver=self.geometry,
-            driven=self.sticker_data[MASTER_GROUPS][POP_MASTER_GROUP],
+            driven=pop_root,
         )
 
         # Geometry Constraint appplied to the first group of the geoSetup chain (Surface group)
         surface_cns = self.parser.apply_constraint(
             "geometryConstraint",
             self.geometry,
-            self.sticker_data[STICKER_SYSTEMS][SYSTEM_GEOSETUP]["chain_transforms"][0],
+            geo_setup_chain[0],
             name="{0}_geoConstraint".format(self.root_name),
         )
 
@@ -415,21 +478,21 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
         normal_cns = self.parser.apply_constraint(
             "normalConstraint",
             self.geometry,
-            self.sticker_data[STICKER_SYSTEMS][SYSTEM_GEOSETUP]["chain_transforms"][1],
+            geo_setup_chain[1],
             aimVector=[0, 0, 1],
             name="{0}_normalConstraint".format(self.root_name),
         )
         # Apply Main Control Constraints to geoSetup surface and detach
-        geo_setup_roots = []
-        for root in self.sticker_data[STICKER_GEOSETUP_DRIVEN_ROOTS]:
-            geo_setup_roots.append(
-                self.parser.apply_constraint(
-                    "parentConstraint",
-                    self.sticker_data[STICKER_SYSTEMS][SYSTEM_GEOSETUP]["joints"][0],
-                    root,
-                    name="{0}_parentConstraint".format(root),
-                )
+        geo_setup_joint = geo_setup["joints"][0]
+        geo_setup_roots = [
+            self.parser.apply_constraint(
+                "parentConstraint",
+                geo_setup_joint,
+                root,
+                name="{0}_parentConstraint".format(root),
             )
+            for root in self.sticker_data[STICKER_GEOSETUP_DRIVEN_ROOTS]
+        ]
         return {
             "POP": cns,
             "surface": surface_cns,
@@ -443,75 +506,65 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
         Returns:
             dict: Dictionary containing all the constraints created
         """
+        systems = self.sticker_data[STICKER_SYSTEMS]
+        sticker_attrs = self.sticker_data[ATTRIBUTES][STICKER_ATTRIBUTES]
+        main_control = systems["mainControl"]
+        surface_ctl = main_control["surfaceCtl"]
+        ctl = main_control["ctl"]
+        geo_setup_chain = systems[SYSTEM_GEOSETUP]["chain_transforms"]
+        look_at_camera = systems["lookAtCamera"]
+        aim_sticker = look_at_camera["aimSticker"]
+        look_at_camera_cns = look_at_camera["cns"]
+        main_ctl_weight = "{0}W0".format(self.sticker_data[CONTROLS][STICKER_CONTROLS][1])
+
         surface_ctl_geo_constraint = self.parser.apply_constraint(
             "geometryConstraint",
             self.geometry,
-            self.sticker_data[STICKER_SYSTEMS]["mainControl"]["surfaceCtl"],
-            name="{0}_geoCns".format(
-                self.sticker_data[STICKER_SYSTEMS]["mainControl"]["surfaceCtl"]
-            ),
+            surface_ctl,
+            name="{0}_geoCns".format(surface_ctl),
         )
         surface_ctl_normal_constraint = self.parser.apply_constraint(
             "normalConstraint",
             self.geometry,
-            self.sticker_data[STICKER_SYSTEMS]["mainControl"]["surfaceCtl"],
+            surface_ctl,
             aimVector=[0, 0, 1],
-            name="{0}_normalCns".format(
-                self.sticker_data[STICKER_SYSTEMS]["mainControl"]["surfaceCtl"]
-            ),
+            name="{0}_normalCns".format(surface_ctl),
         )
 
         drive_geo_setup = self.parser.apply_constraint(
             "pointConstraint",
-            self.sticker_data[STICKER_SYSTEMS]["mainControl"]["ctl"],
-            self.sticker_data[STICKER_SYSTEMS][SYSTEM_GEOSETUP]["chain_transforms"][0],
-            name="{0}_pointConstraint".format(
-                self.sticker_data[STICKER_SYSTEMS]["mainControl"]["ctl"]
-            ),
+            ctl,
+            geo_setup_chain[0],
+            name="{0}_pointConstraint".format(ctl),
         )
         # Creates Parent constraint from the main control ctl to the ik system in geoSetup.
         detach_cns_connections = {
-            "attribute": self.sticker_data[ATTRIBUTES][STICKER_ATTRIBUTES].get(
-                "detachPlane"
-            ),
-            "weights": {
-                "{0}W0".format(self.sticker_data[CONTROLS][STICKER_CONTROLS][1]): True
-            },
+            "attribute": sticker_attrs["detachPlane"],
+            "weights": {main_ctl_weight: True},
             "reverseNode": False,
         }
 
         detach_cns = self.parser.apply_constraint(
             "parentConstraint",
-            self.sticker_data[STICKER_SYSTEMS]["mainControl"]["ctl"],
-            self.sticker_data[STICKER_SYSTEMS][SYSTEM_GEOSETUP]["chain_transforms"][2],
-            name="{0}_detachConstraint".format(
-                self.sticker_data[STICKER_SYSTEMS]["mainControl"]["ctl"],
-            ),
+            ctl,
+            geo_setup_chain[2],
+            name="{0}_detachConstraint".format(ctl),
             connections=detach_cns_connections,
         )
 
         look_at_camera_connections = {
-            "attribute": self.sticker_data[ATTRIBUTES][STICKER_ATTRIBUTES].get(
-                "lookAtCamera"
-            ),
+            "attribute": sticker_attrs["lookAtCamera"],
             "weights": {
-                "{0}W0".format(self.sticker_data[CONTROLS][STICKER_CONTROLS][1]): False,
-                "{0}W1".format(
-                    self.sticker_data[STICKER_SYSTEMS]["lookAtCamera"]["aimSticker"]
-                ): True,
+                main_ctl_weight: False,
+                "{0}W1".format(aim_sticker): True,
             },
             "reverseNode": True,
         }
         look_at_camera_space_switch = self.parser.apply_constraint(
             "parentConstraint",
-            [
-                self.sticker_data[STICKER_SYSTEMS]["mainControl"]["ctl"],
-                self.sticker_data[STICKER_SYSTEMS]["lookAtCamera"]["aimSticker"],
-            ],
-            self.sticker_data[STICKER_SYSTEMS]["lookAtCamera"]["cns"],
-            name="{0}_lookCns".format(
-                self.sticker_data[STICKER_SYSTEMS]["lookAtCamera"]["cns"]
-            ),
+            [ctl, aim_sticker],
+            look_at_camera_cns,
+            name="{0}_lookCns".format(look_at_camera_cns),
             connections=look_at_camera_connections,
         )
         return {
@@ -544,52 +597,37 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
 
         translateOffset: oneMinusX_halfY (multiplyDivide), addDirectionalOffset(plusMinusAverage)
         """
+        create_utility_node = self.parser.create_utility_node
         mainControl_attr_ref = self.sticker_data[ATTRIBUTES][STICKER_ATTRIBUTES]
+        offset_projection_attr = mainControl_attr_ref["offsetProjection"]
         # Sticer identifier prefix avoiding duplicate names
-        sticker_prefix = "{0}_{1}".format(self.name, "offsetProjection")
+        sticker_prefix = f"{self.name}_offsetProjection"
 
         # New utility node name
-        name = "{0}_oneMinusX_halfY".format(sticker_prefix)
+        name = f"{sticker_prefix}_oneMinusX_halfY"
 
         # Create utility node
-        oneminusx_doubley = self.parser.create_utility_node(
+        oneminusx_doubley = create_utility_node(
             "multiplyDivide",  # Type of utility node created
             node_name=name,  # Name of utility node
             asUtility=True,  # If it's a utility node
-            connections=[  # Connection list that will be parsed and automatically create connections
-                {
-                    mainControl_attr_ref.get(
-                        "offsetProjection"  # Driver
-                    ): "{0}.input1X".format(
-                        name
-                    )  # Driven
-                },
-                {
-                    mainControl_attr_ref.get("offsetProjection"): "{0}.input1Y".format(
-                        name
-                    )
-                },
+            connections=[  # (Driver, Driven) list that will be parsed into connections
+                (offset_projection_attr, f"{name}.input1X"),
+                (offset_projection_attr, f"{name}.input1Y"),
             ],
             # Attribute dictionary with custom values
             attributes={"input2X": -1, "input2Y": 0.5},
         )
 
-        name = "{0}_addDirectionalOffset".format(sticker_prefix)
-        add_directional_offset = self.parser.create_utility_node(
+        name = f"{sticker_prefix}_addDirectionalOffset"
+        input_2d = f"{name}.input2D[0]."
+        add_directional_offset = create_utility_node(
             "plusMinusAverage",
             node_name=name,
             asUtility=True,
             connections=[
-                {
-                    "{0}.outputX".format(
-                        oneminusx_doubley
-                    ): "{0}.input2D[0].input2Dx".format(name)
-                },
-                {
-                    "{0}.outputY".format(
-                        oneminusx_doubley
-                    ): "{0}.input2D[0].input2Dy".format(name)
-                },
+                (f"{oneminusx_doubley}.outputX", input_2d + "input2Dx"),
+                (f"{oneminusx_doubley}.outputY", input_2d + "input2Dy"),
             ],
             attributes={"input2D[1].input2Dx": -0.5, "input2D[1].input2Dy": 0.8},
         )
@@ -610,239 +648,164 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
         self, sticker_prefix, mainControl_attr_ref, add_directional_offset
     ):
         """Crea el subsistema translate_offset basado en el atributo offsetProjection"""
-        name = "{0}_disableIfDetach".format(sticker_prefix)
+        create_utility_node = self.parser.create_utility_node
+        name = f"{sticker_prefix}_disableIfDetach"
+        directional_offset_x = f"{add_directional_offset}.output2D.output2Dx"
 
-        disable_if_detach_node = self.parser.create_utility_node(
+        disable_if_detach_node = create_utility_node(
             "condition",
             node_name=name,
             asUtility=True,
             connections=[
-                {mainControl_attr_ref.get("detachPlane"): "{0}.firstTerm".format(name)},
-                {
-                    "{0}.output2D.output2Dx".format(
-                        add_directional_offset
-                    ): "{0}.colorIfFalseB".format(name)
-                },
-                {
-                    "{0}.output2D.output2Dx".format(
-                        add_directional_offset
-                    ): "{0}.colorIfTrueR".format(name)
-                },
+                (mainControl_attr_ref["detachPlane"], f"{name}.firstTerm"),
+                (directional_offset_x, f"{name}.colorIfFalseB"),
+                (directional_offset_x, f"{name}.colorIfTrueR"),
             ],
             attributes={"secondTerm": 1, "colorIfFalseR": 0},
         )
-        name = "{0}_reverseOffset".format(sticker_prefix)
-        reverseOffset_node = self.parser.create_utility_node(
+        name = f"{sticker_prefix}_reverseOffset"
+        reverseOffset_node = create_utility_node(
             "multiplyDivide",
             node_name=name,
             asUtility=True,
-            connections=[
-                {
-                    "{0}.outColorB".format(
-                        disable_if_detach_node
-                    ): "{0}.input1Z".format(name)
-                }
-            ],
+            connections=[(f"{disable_if_detach_node}.outColorB", f"{name}.input1Z")],
             attributes={"input2Z": -1},
         )
 
-        name = "{0}_layerOffset".format(sticker_prefix)
-        layerOffset_node = self.parser.create_utility_node(
+        name = f"{sticker_prefix}_layerOffset"
+        layerOffset_node = create_utility_node(
             "plusMinusAverage",
             node_name=name,
             asUtility=True,
             connections=[
-                {
-                    "{0}.outputZ".format(
-                        reverseOffset_node
-                    ): "{0}.input2D[0].input2Dx".format(name)
-                }
+                (f"{reverseOffset_node}.outputZ", f"{name}.input2D[0].input2Dx")
             ],
             attributes={"input2D[1].input2Dx": 1},
         )
-        self.parser._create_utility_connections(
-            [
-                {
-                    "{0}.outColorB".format(
-                        disable_if_detach_node
-                    ): "{0}.translateZ".format(
-                        self.sticker_data[STICKER_SYSTEMS][SYSTEM_GEOSETUP]
-                        .get("chain_transforms")[-1]
-                        .name()
-                    )
-                }
-            ]
-        )
-        for layer_definition in self.sticker_data[STICKER_SYSTEMS][
-            SYSTEM_LAYERS
-        ].values():
-            self.parser._create_utility_connections(
-                [
-                    {
-                        "{0}.output2Dx".format(
-                            layerOffset_node
-                        ): "{0}.translateZ".format(
-                            layer_definition.get("layerCtlRoot").name()
-                        )
-                    },
-                    {
-                        "{0}.outColorR".format(
-                            disable_if_detach_node
-                        ): "{0}.translateZ".format(
-                            layer_definition.get("transOffset").name()
-                        )
-                    },
-                ]
+        geo_setup_offset = self.sticker_data[STICKER_SYSTEMS][SYSTEM_GEOSETUP][
+            "chain_transforms"
+        ][-1]
+        # Every layer's offsets and the geoSetup one are submitted as a single list
+        offset_connections = [
+            (f"{disable_if_detach_node}.outColorB", f"{geo_setup_offset}.translateZ")
+        ]
+        layer_offset_output = f"{layerOffset_node}.output2Dx"
+        disable_if_detach_output = f"{disable_if_detach_node}.outColorR"
+        layers = self.sticker_data[STICKER_SYSTEMS][SYSTEM_LAYERS]
+        for layer_definition in layers.values():
+            offset_connections.extend(
+                (
+                    (
+                        layer_offset_output,
+                        f"{layer_definition['layerCtlRoot']}.translateZ",
+                    ),
+                    (
+                        disable_if_detach_output,
+                        f"{layer_definition['transOffset']}.translateZ",
+                    ),
+                )
             )
+        self.parser._create_utility_connections(offset_connections)
         # Create translateOffset_disabledIfDetach
 
     def create_scale_offset_subsystem(
         self, sticker_prefix, mainControl_attr_ref, add_directional_offset
     ):
         """ """
-        name = "{0}_addLookAtCameraOffset".format(sticker_prefix)
-        add_lookatcamera_offset_node = self.parser.create_utility_node(
+        create_utility_node = self.parser.create_utility_node
+        directional_offset_y = f"{add_directional_offset}.output2Dy"
+        main_control = self.sticker_data[STICKER_SYSTEMS]["mainControl"]
+
+        name = f"{sticker_prefix}_addLookAtCameraOffset"
+        add_lookatcamera_offset_node = create_utility_node(
             "plusMinusAverage",
             node_name=name,
             asUtility=True,
-            connections=[
-                {
-                    "{0}.output2Dy".format(
-                        add_directional_offset
-                    ): "{0}.input2D[0].input2Dx".format(name)
-                }
-            ],
+            connections=[(directional_offset_y, f"{name}.input2D[0].input2Dx")],
             attributes={"input2D[1].input2Dx": 1.2},
         )
 
-        name = "{0}_scaleIfLookAtCamera".format(sticker_prefix)
-        scale_if_lookatcamera_node = self.parser.create_utility_node(
+        name = f"{sticker_prefix}_scaleIfLookAtCamera"
+        scale_if_lookatcamera_node = create_utility_node(
             "condition",
             node_name=name,
             asUtility=True,
             connections=[
-                {
-                    "{0}.output2Dy".format(
-                        add_directional_offset
-                    ): "{0}.colorIfFalseB".format(name)
-                },
-                {
-                    "{0}.output2Dx".format(
-                        add_lookatcamera_offset_node
-                    ): "{0}.colorIfTrueB".format(name)
-                },
-                {
-                    mainControl_attr_ref.get("lookAtCamera"): "{0}.firstTerm".format(
-                        name
-                    )
-                },
+                (directional_offset_y, f"{name}.colorIfFalseB"),
+                (f"{add_lookatcamera_offset_node}.output2Dx", f"{name}.colorIfTrueB"),
+                (mainControl_attr_ref["lookAtCamera"], f"{name}.firstTerm"),
             ],
             attributes={"secondTerm": 1},
         )
-        name = "{0}_scaleInit".format(sticker_prefix)
-        scaleInit_node = self.parser.create_utility_node(
+        name = f"{sticker_prefix}_scaleInit"
+        scaleInit_node = create_utility_node(
             "multiplyDivide",
             node_name=name,
             asUtility=True,
             connections=[
-                {
-                    "{0}.scale".format(
-                        self.sticker_data[STICKER_SYSTEMS]["mainControl"]["ctl"].name()
-                    ): "{0}.input1".format(name)
-                },
-                {
-                    "{0}.scale".format(
-                        self.sticker_data[STICKER_SYSTEMS]["mainControl"][
-                            "scaleInit"
-                        ].name()
-                    ): "{0}.input2".format(name)
-                },
+                (f"{main_control['ctl']}.scale", f"{name}.input1"),
+                (f"{main_control['scaleInit']}.scale", f"{name}.input2"),
             ],
         )
-        name = "{0}_flipStickerX".format(sticker_prefix)
-        flipx_sticker_condition = self.parser.create_utility_node(
+        name = f"{sticker_prefix}_flipStickerX"
+        flipx_sticker_condition = create_utility_node(
             "condition",
             node_name=name,
             asUtility=True,
-            connections=[
-                {mainControl_attr_ref.get("flipX"): "{0}.firstTerm".format(name)},
-            ],
+            connections=[(mainControl_attr_ref["flipX"], f"{name}.firstTerm")],
             attributes={"secondTerm": 1, "colorIfTrueR": -1, "colorIfFalseR": 1},
         )
 
-        name = "{0}_flipStickerY".format(sticker_prefix)
-        flipy_sticker_condition = self.parser.create_utility_node(
+        name = f"{sticker_prefix}_flipStickerY"
+        flipy_sticker_condition = create_utility_node(
             "condition",
             node_name=name,
             asUtility=True,
-            connections=[
-                {mainControl_attr_ref.get("flipY"): "{0}.firstTerm".format(name)},
-            ],
+            connections=[(mainControl_attr_ref["flipY"], f"{name}.firstTerm")],
             attributes={"secondTerm": 1, "colorIfTrueR": -1, "colorIfFalseR": 1},
         )
-        name = "{0}_flipScaleSticker".format(sticker_prefix)
-        flip_scale_sticker = self.parser.create_utility_node(
+        name = f"{sticker_prefix}_flipScaleSticker"
+        flip_scale_sticker = create_utility_node(
             "multiplyDivide",
             node_name=name,
             asUtility=True,
             connections=[
-                {
-                    "{0}.outColorR".format(
-                        flipx_sticker_condition
-                    ): "{0}.input1.input1X".format(name)
-                },
-                {
-                    "{0}.outColorR".format(
-                        flipy_sticker_condition
-                    ): "{0}.input1.input1Y".format(name)
-                },
-                {
-                    "{0}.outputX".format(scaleInit_node): "{0}.input2.input2X".format(
-                        name
-                    )
-                },
-                {
-                    "{0}.outputY".format(scaleInit_node): "{0}.input2.input2Y".format(
-                        name
-                    )
-                },
+                (f"{flipx_sticker_condition}.outColorR", f"{name}.input1.input1X"),
+                (f"{flipy_sticker_condition}.outColorR", f"{name}.input1.input1Y"),
+                (f"{scaleInit_node}.outputX", f"{name}.input2.input2X"),
+                (f"{scaleInit_node}.outputY", f"{name}.input2.input2Y"),
             ],
         )
-        for layer_definition in self.sticker_data[STICKER_SYSTEMS][
-            SYSTEM_LAYERS
-        ].values():
-            self.parser._create_utility_connections(
-                [
-                    {
-                        "{0}.outColorB".format(
-                            scale_if_lookatcamera_node
-                        ): "{0}.scaleZ".format(layer_definition.get("scaleOffset"))
-                    },
-                    {
-                        "{0}.outputY".format(
-                            flip_scale_sticker
-                        ): "{0}.scaleY".format(layer_definition.get("scaleOffset"))
-                    },
-                    {
-                        "{0}.outputX".format(
-                            flip_scale_sticker
-                        ): "{0}.scaleX".format(layer_definition.get("scaleOffset"))
-                    }
-                ]
+        # Every layer's scale offset is submitted as a single list
+        scale_z_output = f"{scale_if_lookatcamera_node}.outColorB"
+        scale_y_output = f"{flip_scale_sticker}.outputY"
+        scale_x_output = f"{flip_scale_sticker}.outputX"
+        scale_connections = []
+        layers = self.sticker_data[STICKER_SYSTEMS][SYSTEM_LAYERS]
+        for layer_definition in layers.values():
+            scale_offset = layer_definition["scaleOffset"]
+            scale_connections.extend(
+                (
+                    (scale_z_output, f"{scale_offset}.scaleZ"),
+                    (scale_y_output, f"{scale_offset}.scaleY"),
+                    (scale_x_output, f"{scale_offset}.scaleX"),
+                )
             )
+        self.parser._create_utility_connections(scale_connections)
 
     def create_layer_shading_nodes(self):
         """Creates shading nodes for each layer"""
+        files = self.sticker_data["files"]
+        projections = self.sticker_data["projections"]
         # Use layer name and definition to create shading nodes
-        for layer_name, layer_definition in self.sticker_data[STICKER_SYSTEMS][
-            SYSTEM_LAYERS
-        ].items():
+        layers = self.sticker_data[STICKER_SYSTEMS][SYSTEM_LAYERS]
+        for layer_name, layer_definition in layers.items():
             # Fetch the place3dTexture node from the layer definition
-            p3d = layer_definition.get("place3dTexture")
+            p3d = layer_definition["place3dTexture"]
             # Create entry for each layer in the sticker_data.files dictionary
-            self.sticker_data["files"][layer_name] = {}
+            files[layer_name] = {}
             # Create entry for each layer in the sticker_data.projections dictionary
-            self.sticker_data["projections"][layer_name] = {}
+            projections[layer_name] = {}
             # Call create_shading_nodes function to create shading nodes for each layer
             self.create_maps_shading_nodes(layer_name, p3d)
 
@@ -850,52 +813,53 @@ class Sticker:  # pylint: disable=too-many-instance-attributes
         """
         Creates file, projection & aiMatte nodes for each map declared in the sticker
         """
-        for texture_map in self.texture_maps:
-            is_sequence = self.is_sequence
-            frame_extension = ""
-
-            texture_map_file_path = self.file_path
-
-
-            if self.is_sequence == 2:
-                is_sequence = 1
-                frame_extension = re.search(
-                    r"\.([\d]*)\.", texture_map_file_path
-                ).group(1)
+        texture_map_file_path = self.file_path
+        # Multi pose stickers are file sequences whose frame is driven by the layer attribute
+        multi_pose = self.is_sequence == 2
+        is_sequence = self.is_sequence
+        frame_extension = ""
+        frame_driver = None
+        if multi_pose:
+            is_sequence = 1
+            frame_match = FRAME_NUMBER_RE.search(texture_map_file_path)
+            if frame_match is None:
+                raise ValueError(
+                    f"Multi pose sticker {self.name!r} needs a numbered image sequence, "
+                    f"no frame number found in {texture_map_file_path!r}"
+                )
+            frame_extension = frame_match.group(1)
+            main_ctl = self.sticker_data[STICKER_SYSTEMS]["mainControl"]["ctl"]
+            frame_driver = f"{main_ctl}.{layer_name}Texture"
+
+        name = self.name
+        create_file_node = self.parser.create_file_node
+        create_projection_node = self.parser.create_projection_node
+        create_aiMatte_material = self.parser.create_aiMatte_material
+        create_connections = self.parser._create_utility_connections
+        layer_projections = self.sticker_data["projections"][layer_name]
+        matte_materials = self.sticker_data["materials"]["aiMatte"]
 
-            _p2d, file_node = self.parser.create_file_node(
-                self.name,
+        for texture_map in self.texture_maps:
+            _p2d, file_node = create_file_node(
+                name,
                 layer_name,
                 texture_map,
                 texture_map_file_path,
                 frame_extension,
                 is_sequence,
             )
-            if self.is_sequence == 2:
-                self.parser._create_utility_connections([
-                    {
-                        "{0}.{1}Texture".format(
-                            self.sticker_data[STICKER_SYSTEMS]["mainControl"]["ctl"],
-                            layer_name
-
-                        ):"{0}.frameExtension".format(file_node)
-                    }
-                ])
-
-            projection_node = self.parser.create_projection_node(
-                self.name, layer_name, texture_map, p3d, file_node
-            )
-            matte_marerial = self.parser.create_aiMatte_material(
-                self.name, layer_name, texture_map, projection_node
-            )
-            ## Update sticker_data with the created nodes
+            if frame_driver is not None:
+                create_connections([(frame_driver, f"{file_node}.frameExtension")])
 
-            self.sticker_data["projections"][layer_name].update(
-                {texture_map: projection_node}
+            projection_node = create_projection_node(
+                name, layer_name, texture_map, p3d, file_node
             )
-            self.sticker_data["materials"]["aiMatte"].update(
-                {texture_map: matte_marerial}
+            matte_marerial = create_aiMatte_material(
+                name, layer_name, texture_map, projection_node
             )
+            ## Update sticker_data with the created nodes
+            layer_projections[texture_map] = projection_node
+            matte_materials[texture_map] = matte_marerial
 
 
 
@@ -8,7 +8,7 @@
 import os
 import sys
 
-import maya.cmds as cmds
+import maya.api.OpenMaya as om
 import maya.OpenMayaUI as omui
 from PySide2 import QtCore, QtUiTools, QtWidgets
 from PySide2.QtCore import QTimer
@@ -16,41 +16,109 @@ from shiboken2 import wrapInstance
 
 from . import builder
 
+_INT = int if sys.version_info.major >= 3 else long  # pylint: disable=undefined-variable
+_MAIN_WINDOW = None
+# Kept across importlib.reload, so show_ui can still close the dialog opened before it
+_STICKER_UI = globals().get("_STICKER_UI")
+_UI_CACHE = {}  # .ui file path -> QByteArray with its contents
+
+WINDOW_TITLE = "Sticker UI"
+UI_FILE = os.path.join(os.path.dirname(__file__), "sticker_simple.ui")
+FILE_DIALOG_CAPTION = "Open File"
+FILE_DIALOG_FILTER = "Images (*.png *.xpm *.jpg)"
+MESSAGE_TIMEOUT = 4000  # Milliseconds
+EMPTY_SELECTION_MESSAGE = "Select the vertex the sticker will be attached to"
+# Sticker.is_sequence value of each frame type radio button
+FRAME_TYPE_IDS = (
+    ("single_img_rb", 0),
+    ("image_seq_rb", 1),
+    ("multi_pose_rb", 2),
+)
+
 
 def maya_main_window():
     """
     Return the Maya main window widget as a Python object
     """
-    main_window_ptr = omui.MQtUtil.mainWindow()
-    if sys.version_info.major >= 3:
-        return wrapInstance(int(main_window_ptr), QtWidgets.QWidget)
-    else:
-        return wrapInstance(long(main_window_ptr), QtWidgets.QWidget)
+    global _MAIN_WINDOW  # pylint: disable=global-statement
+    if _MAIN_WINDOW is None:
+        main_window_ptr = omui.MQtUtil.mainWindow()
+        _MAIN_WINDOW = wrapInstance(_INT(main_window_ptr), QtWidgets.QWidget)
+    return _MAIN_WINDOW
+
+
+def load_ui_bytes(ui_file):
+    """Return the contents of a .ui file, reading it from disk only the first time
+
+    Args:
+        ui_file (str): Path of the .ui file
+
+    Returns:
+        QtCore.QByteArray: Contents of the file
+    """
+    if ui_file not in _UI_CACHE:
+        f = QtCore.QFile(ui_file)
+        f.open(QtCore.QFile.ReadOnly)
+        _UI_CACHE[ui_file] = f.readAll()
+        f.close()
+    return _UI_CACHE[ui_file]
+
+
+def show_ui():
+    """Close any previous Sticker UI and open a new one.
+
+    The dialog is built on the next event loop tick, so the calling script
+    or shelf button returns immediately.
+    """
+    QTimer.singleShot(0, _show_ui)
+
+
+def _show_ui():
+    global _STICKER_UI  # pylint: disable=global-statement
+    if _STICKER_UI is not None:
+        try:
+            _STICKER_UI.close()
+            _STICKER_UI.deleteLater()
+        except RuntimeError:
+            # The underlying Qt object was already deleted
+            pass
+    _STICKER_UI = StickerUI()
+    _STICKER_UI.show()
 
 
 class StickerUI(QtWidgets.QDialog):
 
-    def __init__(self, parent=maya_main_window()):
+    # .ui form loaded by init_ui, other dialog variants only need to override it
+    ui_file = UI_FILE
+
+    def __init__(self, parent=None):
+        parent = parent or maya_main_window()
         super(StickerUI, self).__init__(parent)
 
-        self.setWindowTitle("Sticker UI")
+        self.setWindowTitle(WINDOW_TITLE)
         self.builder = builder.Builder()
         self.init_ui()
         self.create_layout()
         self.create_connections()
         self.frame_type = 0
 
+        # Kept between browses, so it reopens on the last folder used
+        self.file_dialog = QtWidgets.QFileDialog(
+            self, FILE_DIALOG_CAPTION, "", FILE_DIALOG_FILTER
+        )
+        self.file_dialog.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+
     def init_ui(self):
-        f = QtCore.QFile(os.path.join(os.path.dirname(__file__), "sticker_simple.ui"))
-        f.open(QtCore.QFile.ReadOnly)
+        buffer = QtCore.QBuffer()
+        buffer.setData(load_ui_bytes(self.ui_file))
+        buffer.open(QtCore.QBuffer.ReadOnly)
 
         loader = QtUiTools.QUiLoader()
-        self.ui = loader.load(f, parentWidget=self)
+        self.ui = loader.load(buffer, parentWidget=self)
 
-        f.close()
+        buffer.close()
 
     def create_layout(self):
-        self.ui.setParent(self)
         self.ui.layout().setContentsMargins(6, 6, 6, 6)
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(self.ui)
@@ -62,9 +130,10 @@ class StickerUI(QtWidgets.QDialog):
         self.ui.geometry_pb.clicked.connect(self.set_geometry)
         self.ui.create_pb.clicked.connect(self.create_sticker)
         self.ui.cancel_pb.clicked.connect(self.close)
-        self.ui.single_img_rb.toggled.connect(self.set_frame_type)
-        self.ui.image_seq_rb.toggled.connect(self.set_frame_type)
-        self.ui.multi_pose_rb.toggled.connect(self.set_frame_type)
+        self.frame_type_group = QtWidgets.QButtonGroup(self)
+        for radio_button_name, frame_type in FRAME_TYPE_IDS:
+            self.frame_type_group.addButton(getattr(self.ui, radio_button_name), frame_type)
+        self.frame_type_group.idClicked.connect(self.set_frame_type)
 
     #   ____ ____  _____    _  _____ _____   ____ _____ ___ ____ _  _______ ____
     #  / ___|  _ \| ____|  / \|_   _| ____| / ___|_   _|_ _/ ___| |/ / ____|  _ \
@@ -85,7 +154,7 @@ class StickerUI(QtWidgets.QDialog):
         definition["geometry"] = self.ui.geometry_le.text()
         definition["name"] = self.ui.name_le.text()
         definition["file_path"] = self.ui.folder_path_le.text()
-        definition["is_sequence"] = self.get_sequence_type()
+        definition["is_sequence"] = self.frame_type
 
         # Get all layers from the list widget
         definition["layers"] = [{"layerName": "base"}]
@@ -102,34 +171,25 @@ class StickerUI(QtWidgets.QDialog):
     #   | |__| |_| |_  | |  | |_| | | | | (__| |_| | (_) | | | \__ \
     #    \____/|_____| |_|   \__,_|_| |_|\___|\__|_|\___/|_| |_|___/
     #
-    def set_frame_type(self):
-        radio_button = self.sender()
-        radio_text = str(radio_button.text()).replace(" ","")
-        if radio_button.isChecked():
-            self.frame_type = radio_text
-
-    def get_sequence_type(self):
-        seq_type_dict = {
-            "SingleImage":0,
-            "ImageSequence":1,
-            "MultiPose":2
-        }
-        return seq_type_dict.get(self.frame_type,0)
+    def set_frame_type(self, frame_type):
+        self.frame_type = frame_type
 
     def set_geometry(self):
         """Set the geometry field to the selected object"""
-        vertex_selected = cmds.ls(selection=True)[0]
+        selection = om.MGlobal.getActiveSelectionList()
+        if selection.isEmpty():
+            self.set_message_text(EMPTY_SELECTION_MESSAGE)
+            return
+        vertex_selected = selection.getSelectionStrings(0)[0]
         self.ui.geometry_le.setText(vertex_selected)
 
     def set_message_text(self, message):
         self.ui.message_lbl.setText(message)
-        QtCore.QTimer.singleShot(4000, self.clean_message_text)
+        QtCore.QTimer.singleShot(MESSAGE_TIMEOUT, self.clean_message_text)
 
     def clean_message_text(self):
         self.ui.message_lbl.setText("")
 
     def select_file(self):
-        fileName = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Open File", "Images (*.png *.xpm *.jpg)"
-        )[0]
-        self.ui.folder_path_le.setText(fileName)
+        if self.file_dialog.exec_():
+            self.ui.folder_path_le.setText(self.file_dialog.selectedFiles()[0])
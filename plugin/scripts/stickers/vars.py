@@ -1,4 +1,3 @@
-SUPPORTED_FORMATS = [".PNG", ".png"]
 MASTER_GROUPS = "masterGroups"
 
 STICKER_MASTER_GROUP = "stickerMaster"
@@ -0,0 +1,36 @@
+"""Tests of the sticker module helpers that don't need a running Maya"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "plugin", "scripts"))
+
+from stickers import sticker  # pylint: disable=wrong-import-position
+
+
+class FrameNumberTest(unittest.TestCase):
+    """FRAME_NUMBER_RE takes the frame number right before the file extension"""
+
+    def frame_number(self, file_path):
+        match = sticker.FRAME_NUMBER_RE.search(file_path)
+        return match.group(1) if match else None
+
+    def test_single_extension(self):
+        self.assertEqual(self.frame_number("C:/images/eye.0001.png"), "0001")
+
+    def test_double_extension(self):
+        self.assertEqual(self.frame_number("/images/eye.0012.exr.tx"), "0012")
+
+    def test_numbered_name_before_the_frame(self):
+        self.assertEqual(self.frame_number("/images/shot.12.0001.png"), "0001")
+
+    def test_numbered_folder(self):
+        self.assertEqual(self.frame_number("/images/v1.2/eye.0003.png"), "0003")
+
+    def test_no_frame_number(self):
+        self.assertIsNone(self.frame_number("/images/eye.png"))
+
+
+if __name__ == "__main__":
+    unittest.main()